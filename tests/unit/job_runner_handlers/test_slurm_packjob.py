@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import Counter
+
 import pytest
 import os
 
@@ -59,39 +61,44 @@ def test_format_directives(job_conf: dict, lines: list):
     assert JOB_RUNNER_HANDLER.format_directives(job_conf) == lines
 
 
-@pytest.mark.parametrize(
-    'job_ids,cmd',
-    [
-        [['1234567'], ['squeue', '-h', '-j', '1234567']],
-        [
-            ['1234567', '709394', '30624700'],
-            ['squeue', '-h', '-j', '1234567,709394,30624700'],
-        ],
-    ],
+POLL_CASES = (
+    (('1234567',), ('squeue', '-h', '-j', '1234567')),
+    (
+        ('1234567', '709394', '30624700'),
+        ('squeue', '-h', '-j', '1234567,709394,30624700'),
+    ),
+)
+
+
+@pytest.mark.parametrize('job_ids,cmd', POLL_CASES)
+def test_get_poll_many_cmd(job_ids: tuple, cmd: tuple):
+    assert JOB_RUNNER_HANDLER.get_poll_many_cmd(list(job_ids)) == list(cmd)
+
+
+POLL_OUT = (
+    'HEADING\n'
+    '1234567  JOB PROPERTIES\n'
+    '709394   JOB PROPERTIES\n'
+    '30624700 JOB PROPERTIES\n'
+)
+POLL_OUT_HETJOB = (
+    'HEADING\n'
+    '1234567+0 JOB PROPERTIES (HETERO)\n'
+    '1234567+1 JOB PROPERTIES (HETERO)\n'
+    '709394    JOB PROPERTIES\n'
+    '30624700  JOB PROPERTIES\n'
 )
-def test_get_poll_many_cmd(job_ids: list, cmd: list):
-    assert JOB_RUNNER_HANDLER.get_poll_many_cmd(job_ids) == cmd
 
 
 @pytest.mark.parametrize(
     'out,job_ids',
     [
-        [
-            """HEADING
-1234567  JOB PROPERTIES
-709394   JOB PROPERTIES
-30624700 JOB PROPERTIES
-""", ['1234567', '30624700', '709394'],
-        ],
-        [
-            """HEADING
-1234567+0 JOB PROPERTIES (HETERO)
-1234567+1 JOB PROPERTIES (HETERO)
-709394    JOB PROPERTIES
-30624700  JOB PROPERTIES
-""", ['1234567', '30624700', '709394'],
-        ],
+        [POLL_OUT, ['1234567', '30624700', '709394']],
+        [POLL_OUT_HETJOB, ['1234567', '30624700', '709394']],
     ],
 )
 def test_filter_poll_many_output(job_ids: list, out: str):
-    assert sorted(JOB_RUNNER_HANDLER.filter_poll_many_output(out)) == job_ids
+    assert (
+        Counter(JOB_RUNNER_HANDLER.filter_poll_many_output(out))
+        == Counter(job_ids)
+    )
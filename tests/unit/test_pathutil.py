@@ -20,7 +20,7 @@ import os
 from pathlib import Path
 import pytest
 from pytest import param
-from typing import Callable, Dict, Iterable, List, Set
+from typing import Callable, Dict, FrozenSet, Iterable, List
 from unittest.mock import Mock, patch, call
 
 from cylc.flow.exceptions import InputError, WorkflowFilesError
@@ -53,6 +53,7 @@ from .conftest import MonkeyMock
 
 
 HOME = Path.home()
+WORKFLOW_RUN_DIR = str(HOME / 'cylc-run' / 'my-workflow' / 'dream')
 
 
 @pytest.mark.parametrize(
@@ -73,13 +74,15 @@ def test_explicit_relative_path_regex(string: str, match_expected: bool):
     assert bool(EXPLICIT_RELATIVE_PATH_REGEX.match(string)) is match_expected
 
 
-@pytest.mark.parametrize(
-    'path, expected',
-    [('~/moo', os.path.join(HOME, 'moo')),
-     ('$HOME/moo', os.path.join(HOME, 'moo')),
-     ('~/$FOO/moo', os.path.join(HOME, 'foo', 'bar', 'moo')),
-     ('$NON_EXIST/moo', '$NON_EXIST/moo')]
+EXPAND_PATH_CASES = (
+    ('~/moo', str(HOME / 'moo')),
+    ('$HOME/moo', str(HOME / 'moo')),
+    ('~/$FOO/moo', str(HOME / 'foo' / 'bar' / 'moo')),
+    ('$NON_EXIST/moo', '$NON_EXIST/moo'),
 )
+
+
+@pytest.mark.parametrize('path, expected', EXPAND_PATH_CASES)
 def test_expand_path(
     path: str, expected: str,
     monkeypatch: pytest.MonkeyPatch
@@ -120,19 +123,27 @@ def test_get_remote_workflow_run_dirs(
     assert result == expected
 
 
-@pytest.mark.parametrize(
-    'func, tail1',
-    [(get_workflow_run_dir, ''),
-     (get_workflow_run_job_dir, '/log/job'),
-     (get_workflow_run_scheduler_log_dir, '/log/scheduler'),
-     (get_workflow_run_config_log_dir, '/log/config'),
-     (get_workflow_run_share_dir, '/share'),
-     (get_workflow_run_work_dir, '/work')]
+RUN_DIR_FUNCS = (
+    ('run', get_workflow_run_dir, ''),
+    ('job', get_workflow_run_job_dir, '/log/job'),
+    ('scheduler-log', get_workflow_run_scheduler_log_dir, '/log/scheduler'),
+    ('config-log', get_workflow_run_config_log_dir, '/log/config'),
+    ('share', get_workflow_run_share_dir, '/share'),
+    ('work', get_workflow_run_work_dir, '/work'),
 )
+RUN_DIR_ARGS = (
+    ('noargs', [], ''),
+    ('withargs', ['comes', 'true'], '/comes/true'),
+)
+
+
 @pytest.mark.parametrize(
-    'args, tail2',
-    [([], ''),
-     (['comes', 'true'], '/comes/true')]
+    'func, tail1, args, tail2',
+    [
+        param(func, tail1, args, tail2, id=f'{func_id}-{args_id}')
+        for func_id, func, tail1 in RUN_DIR_FUNCS
+        for args_id, args, tail2 in RUN_DIR_ARGS
+    ]
 )
 def test_get_workflow_run_dirs(
     func: Callable, tail1: str, args: List[str], tail2: str
@@ -145,9 +156,7 @@ def test_get_workflow_run_dirs(
         args: extra *args
         tail2: expected tail of return value from extra args
     """
-    homedir = os.getenv("HOME")
-
-    expected_result = f'{homedir}/cylc-run/my-workflow/dream{tail1}{tail2}'
+    expected_result = WORKFLOW_RUN_DIR + tail1 + tail2
     assert func('my-workflow/dream', *args) == expected_result
 
 
@@ -165,12 +174,7 @@ def test_get_workflow_run_names(func: Callable, tail: str) -> None:
         cfg: configuration used in mocked global configuration
         tail: expected tail of return value from configuration
     """
-    homedir = os.getenv("HOME")
-
-    assert (
-        func('my-workflow/dream') ==
-        f'{homedir}/cylc-run/my-workflow/dream{tail}'
-    )
+    assert func('my-workflow/dream') == WORKFLOW_RUN_DIR + tail
 
 
 def test_make_workflow_run_tree(
@@ -305,19 +309,16 @@ def test_make_localhost_symlinks_calls_make_symlink_for_each_key_value_dir(
     ])
 
 
-@patch('cylc.flow.pathutil.get_workflow_run_dir')
-@patch('cylc.flow.pathutil.make_symlink_dir')
-@patch('cylc.flow.pathutil.get_dirs_to_symlink')
 def test_incorrect_environment_variables_raise_error(
-    mocked_dirs_to_symlink,
-    mocked_make_symlink,
-    mocked_get_workflow_run_dir,
-    monkeypatch: pytest.MonkeyPatch
+    monkeypatch: pytest.MonkeyPatch, monkeymock: MonkeyMock
 ):
     monkeypatch.delenv('doh', raising=False)
-    mocked_dirs_to_symlink.return_value = {
-        'run': '$doh/cylc-run/test_workflow'}
-    mocked_get_workflow_run_dir.return_value = "rund"
+    monkeymock(
+        'cylc.flow.pathutil.get_dirs_to_symlink',
+        return_value={'run': '$doh/cylc-run/test_workflow'}
+    )
+    monkeymock('cylc.flow.pathutil.make_symlink_dir')
+    monkeymock('cylc.flow.pathutil.get_workflow_run_dir', return_value="rund")
 
     with pytest.raises(WorkflowFilesError) as excinfo:
         make_localhost_symlinks('rund', 'test_workflow')
@@ -327,6 +328,12 @@ def test_incorrect_environment_variables_raise_error(
     ) in str(excinfo.value)
 
 
+def assert_path_gone(path: Path) -> None:
+    """Assert that nothing exists at the path, not even a broken symlink."""
+    with pytest.raises(FileNotFoundError):
+        os.lstat(path)
+
+
 @pytest.mark.parametrize(
     'filetype, expected_err',
     [('dir', None),
@@ -352,8 +359,7 @@ def test_remove_dir_and_target(filetype, expected_err, tmp_path):
             remove_dir_and_target(test_path)
     else:
         remove_dir_and_target(test_path)
-        assert test_path.exists() is False
-        assert test_path.is_symlink() is False
+        assert_path_gone(test_path)
 
 
 @pytest.mark.parametrize(
@@ -390,50 +396,54 @@ def test_remove_dir_and_target_symlinks(target, expected_err, tmp_path):
     else:
         remove_dir_and_target(symlink_path)
         for path in [symlink_path, target_path]:
-            assert path.exists() is False
-            assert path.is_symlink() is False
+            assert_path_gone(path)
 
 
 @pytest.mark.parametrize(
     'func', [remove_dir_and_target, remove_dir_or_file]
 )
-def test_remove_relative(func: Callable, tmp_path: Path):
+def test_remove_relative(
+    func: Callable, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
     """Test that you cannot use remove_dir_and_target() or remove_dir_or_file()
     on relative paths.
 
     When removing a path, we want to be absolute-ly sure where it is!
     """
     # cd to temp dir in case we accidentally succeed in deleting the path
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     with pytest.raises(ValueError) as cm:
         func('foo/bar')
     assert 'Path must be absolute' in str(cm.value)
 
 
-def test_remove_dir_or_file(tmp_path: Path):
+@pytest.mark.parametrize('filetype', ['file', 'symlink', 'dir'])
+def test_remove_dir_or_file(filetype: str, tmp_path: Path):
     """Test remove_dir_or_file()"""
     a_file = tmp_path.joinpath('fyle')
-    a_file.touch()
-    assert a_file.exists()
-    remove_dir_or_file(a_file)
-    assert a_file.exists() is False
-
-    a_symlink = tmp_path.joinpath('simlynk')
-    a_file.touch()
-    a_symlink.symlink_to(a_file)
-    assert a_symlink.is_symlink()
-    remove_dir_or_file(a_symlink)
-    assert a_symlink.is_symlink() is False
-    assert a_file.exists()
-
-    a_dir = tmp_path.joinpath('der')
-    # Add contents to check whole tree is removed
-    sub_dir = a_dir.joinpath('sub_der')
-    sub_dir.mkdir(parents=True)
-    sub_dir.joinpath('fyle').touch()
-    assert a_dir.exists()
-    remove_dir_or_file(a_dir)
-    assert a_dir.exists() is False
+    if filetype == 'file':
+        a_file.touch()
+        path = a_file
+    elif filetype == 'symlink':
+        a_file.touch()
+        path = tmp_path.joinpath('simlynk')
+        path.symlink_to(a_file)
+        assert path.is_symlink()
+    elif filetype == 'dir':
+        path = tmp_path.joinpath('der')
+        # Add contents to check whole tree is removed
+        sub_dir = path.joinpath('sub_der')
+        sub_dir.mkdir(parents=True)
+        sub_dir.joinpath('fyle').touch()
+    else:
+        raise ValueError(filetype)
+
+    assert path.exists()
+    remove_dir_or_file(path)
+    assert_path_gone(path)
+    if filetype == 'symlink':
+        # Should not have removed the symlink target
+        assert a_file.exists()
 
 
 def test_remove_empty_parents(tmp_path: Path):
@@ -485,19 +495,19 @@ def test_remove_empty_parents_bad(path: str, tail: str, exc_msg: str):
     assert exc_msg in str(exc.value)
 
 
-@pytest.mark.parametrize(
-    'dirs, expected',
-    [
-        ([" "], set()),
-        (["foo", "bar"], {"foo", "bar"}),
-        (["foo:bar", "baz/*"], {"foo", "bar", "baz/*"}),
-        ([" :foo :bar:"], {"foo", "bar"}),
-        (["foo/:bar//baz "], {"foo/", "bar/baz"}),
-        ([".foo", "..bar", " ./gah"], {".foo", "..bar", "gah"})
-        # Note '..bar' is a valid filename (doesn't point to parent dir)
-    ]
+RM_DIRS_CASES = (
+    ([" "], frozenset()),
+    (["foo", "bar"], frozenset({"foo", "bar"})),
+    (["foo:bar", "baz/*"], frozenset({"foo", "bar", "baz/*"})),
+    ([" :foo :bar:"], frozenset({"foo", "bar"})),
+    (["foo/:bar//baz "], frozenset({"foo/", "bar/baz"})),
+    ([".foo", "..bar", " ./gah"], frozenset({".foo", "..bar", "gah"})),
+    # Note '..bar' is a valid filename (doesn't point to parent dir)
 )
-def test_parse_rm_dirs(dirs: List[str], expected: Set[str]):
+
+
+@pytest.mark.parametrize('dirs, expected', RM_DIRS_CASES)
+def test_parse_rm_dirs(dirs: List[str], expected: FrozenSet[str]):
     """Test parse_dirs()"""
     assert parse_rm_dirs(dirs) == expected
 